@@ -1,39 +1,110 @@
 """Analyze bicep curl data from CSV file."""
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
+from collections import Counter
 
 
-def analyze_workout_data(csv_file='bicep_curl_data.csv'):
+def summarize_workout_data(csv_file='bicep_curl_data.csv'):
     """
-    Analyze and visualize workout data from CSV.
+    Compute workout summary statistics from CSV.
+    
+    Uses only the standard library so text summaries do not pay for
+    importing pandas or matplotlib.
     
     Args:
         csv_file: Path to the CSV file
+    
+    Returns:
+        dict: Summary statistics
     """
-    # Read the CSV file
-    df = pd.read_csv(csv_file)
+    total_frames = 0
+    detected_frames = 0
+    max_reps = 0
+    angles = []
+    state_counts = Counter()
     
-    # Filter only frames where pose was detected
-    df_detected = df[df['pose_detected'] == True].copy()
+    with open(csv_file, newline='') as file:
+        for row in csv.DictReader(file):
+            total_frames += 1
+            max_reps = max(max_reps, int(row['rep_count']))
+            state_counts[row['state']] += 1
+            
+            # Only frames where pose was detected contribute angles
+            if row['pose_detected'] != 'True':
+                continue
+            detected_frames += 1
+            try:
+                angles.append(float(row['angle']))
+            except ValueError:
+                pass  # 'N/A' values
     
-    # Convert angle to numeric (handle 'N/A' values)
-    df_detected['angle'] = pd.to_numeric(df_detected['angle'], errors='coerce')
+    return {
+        'total_frames': total_frames,
+        'detected_frames': detected_frames,
+        'total_reps': max_reps,
+        'mean_angle': sum(angles) / len(angles) if angles else float('nan'),
+        'min_angle': min(angles) if angles else float('nan'),
+        'max_angle': max(angles) if angles else float('nan'),
+        'state_counts': state_counts.most_common(),
+    }
+
+
+def print_summary(summary):
+    """
+    Print a workout summary to the console.
+    
+    Args:
+        summary: Dictionary returned by summarize_workout_data()
+    """
+    total = summary['total_frames']
+    detected = summary['detected_frames']
     
     print("=" * 60)
     print("WORKOUT SUMMARY")
     print("=" * 60)
-    print(f"Total frames captured: {len(df)}")
-    print(f"Frames with pose detected: {len(df_detected)} ({len(df_detected)/len(df)*100:.1f}%)")
-    print(f"Total reps completed: {df['rep_count'].max()}")
-    print(f"Average angle: {df_detected['angle'].mean():.2f}°")
-    print(f"Min angle (max contraction): {df_detected['angle'].min():.2f}°")
-    print(f"Max angle (max extension): {df_detected['angle'].max():.2f}°")
+    
+    if total == 0:
+        print("No frames recorded.")
+        return
+    
+    print(f"Total frames captured: {total}")
+    print(f"Frames with pose detected: {detected} ({detected/total*100:.1f}%)")
+    print(f"Total reps completed: {summary['total_reps']}")
+    print(f"Average angle: {summary['mean_angle']:.2f}°")
+    print(f"Min angle (max contraction): {summary['min_angle']:.2f}°")
+    print(f"Max angle (max extension): {summary['max_angle']:.2f}°")
     
     # Count time in each state
-    state_counts = df['state'].value_counts()
     print(f"\nTime distribution:")
-    for state, count in state_counts.items():
-        print(f"  {state}: {count} frames ({count/len(df)*100:.1f}%)")
+    for state, count in summary['state_counts']:
+        print(f"  {state}: {count} frames ({count/total*100:.1f}%)")
+
+
+def analyze_workout_data(csv_file='bicep_curl_data.csv', plot=True):
+    """
+    Analyze and visualize workout data from CSV.
+    
+    Args:
+        csv_file: Path to the CSV file
+        plot: If False, print the text summary only
+    """
+    summary = summarize_workout_data(csv_file)
+    print_summary(summary)
+    
+    if not plot or summary['total_frames'] == 0:
+        return
+    
+    # Plotting libraries are heavy; import them only when needed
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    
+    # Read the CSV file
+    df = pd.read_csv(csv_file)
+    
+    # Filter only frames where pose was detected
+    df_detected = df[df['pose_detected'] == True].copy()
+    
+    # Convert angle to numeric (handle 'N/A' values)
+    df_detected['angle'] = pd.to_numeric(df_detected['angle'], errors='coerce')
     
     # Create visualizations
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
@@ -87,12 +158,18 @@ def analyze_workout_data(csv_file='bicep_curl_data.csv'):
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
     
-    csv_file = sys.argv[1] if len(sys.argv) > 1 else 'bicep_curl_data.csv'
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('csv_file', nargs='?', default='bicep_curl_data.csv',
+                        help='Path to the CSV file')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Print the text summary without plotting')
+    args = parser.parse_args()
+    csv_file = args.csv_file
     
     try:
-        analyze_workout_data(csv_file)
+        analyze_workout_data(csv_file, plot=not args.summary_only)
     except FileNotFoundError:
         print(f"Error: CSV file '{csv_file}' not found.")
         print("Please run the main application first to generate workout data.")
@@ -0,0 +1,194 @@
+"""Benchmark CLI startup: time-to-first-frame and time-to-summary."""
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Each snippet runs in a fresh interpreter so import costs are measured cold.
+# The clock starts before any project import and stops after the first
+# result is available.
+
+# Same startup path as main.py: pool construction, warmup, first real frame
+FIRST_FRAME_SNIPPET = '''
+import time
+start = time.perf_counter()
+import cv2
+import numpy as np
+from core import DetectorPool
+video_path = {video_path!r}
+frame = None
+if video_path:
+    cap = cv2.VideoCapture(video_path)
+    ret, frame = cap.read()
+    cap.release()
+if frame is None:
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+with DetectorPool(size=1, warmup=True, static_image_mode=False) as pool:
+    with pool.detector() as detector:
+        detector.process_frame(frame)
+    print(time.perf_counter() - start)
+'''
+
+# Bare detector without warmup, for comparison with the pooled path
+BARE_FIRST_FRAME_SNIPPET = '''
+import time
+start = time.perf_counter()
+import cv2
+import numpy as np
+from core import PoseDetector
+video_path = {video_path!r}
+frame = None
+if video_path:
+    cap = cv2.VideoCapture(video_path)
+    ret, frame = cap.read()
+    cap.release()
+if frame is None:
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+detector = PoseDetector(static_image_mode=False)
+detector.process_frame(frame)
+print(time.perf_counter() - start)
+detector.close()
+'''
+
+# Steady-state frame latency: only process_frame() on a detector that was
+# already acquired from a warmed-up pool is timed
+POOLED_FRAME_SNIPPET = '''
+import time
+import numpy as np
+from core import DetectorPool
+frame = np.zeros((480, 640, 3), dtype=np.uint8)
+with DetectorPool(size=1, warmup=True) as pool:
+    with pool.detector() as detector:
+        start = time.perf_counter()
+        detector.process_frame(frame)
+        print(time.perf_counter() - start)
+'''
+
+SUMMARY_SNIPPET = '''
+import time
+start = time.perf_counter()
+from analyze_data import summarize_workout_data
+summarize_workout_data({csv_file!r})
+print(time.perf_counter() - start)
+'''
+
+
+def run_snippet(snippet):
+    """
+    Run a snippet in a fresh interpreter and return the seconds it prints.
+    
+    Args:
+        snippet: Python source that prints a single float as its last line
+    
+    Returns:
+        float: Elapsed time in seconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', snippet],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Benchmark snippet failed (exit code {result.returncode}):\n"
+            f"{result.stderr.strip()}"
+        )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure(snippet, repeats):
+    """
+    Run a snippet several times and summarize the timings.
+    
+    Args:
+        snippet: Python source passed to run_snippet()
+        repeats: Number of fresh-interpreter runs
+    
+    Returns:
+        dict: Median, min and max elapsed time in milliseconds
+    """
+    timings = [run_snippet(snippet) * 1000 for _ in range(repeats)]
+    return {
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'max_ms': round(max(timings), 2),
+    }
+
+
+def project_version():
+    """Read the project version from pyproject.toml."""
+    with open(os.path.join(ROOT, 'pyproject.toml')) as file:
+        match = re.search(r'^version\s*=\s*"([^"]+)"', file.read(), re.M)
+    return match.group(1) if match else 'unknown'
+
+
+def run_benchmark(video_path='vid.mp4', csv_file='bicep_curl_data.csv',
+                  repeats=5):
+    """
+    Measure startup latency of the detector and summary paths.
+    
+    Args:
+        video_path: Video whose first frame is processed (blank frame if missing)
+        csv_file: CSV file to summarize
+        repeats: Number of fresh-interpreter runs per measurement
+    
+    Returns:
+        dict: Benchmark record suitable for JSON serialization
+    """
+    # The snippets run with cwd=ROOT, so pin paths to the caller's cwd
+    csv_file = os.path.abspath(csv_file)
+    video_path = os.path.abspath(video_path)
+    if not os.path.exists(video_path):
+        video_path = None
+    
+    return {
+        'version': project_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'repeats': repeats,
+        'video_path': video_path or 'blank',
+        'csv_file': csv_file,
+        'time_to_first_frame': measure(
+            FIRST_FRAME_SNIPPET.format(video_path=video_path), repeats
+        ),
+        'time_to_first_frame_bare': measure(
+            BARE_FIRST_FRAME_SNIPPET.format(video_path=video_path), repeats
+        ),
+        'pooled_frame': measure(POOLED_FRAME_SNIPPET, repeats),
+        'time_to_summary': measure(
+            SUMMARY_SNIPPET.format(csv_file=csv_file), repeats
+        ),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--video', default='vid.mp4',
+                        help='Video whose first frame is processed')
+    parser.add_argument('--csv', default='bicep_curl_data.csv',
+                        help='CSV file to summarize')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='Fresh-interpreter runs per measurement')
+    parser.add_argument('--output',
+                        help='Append the result as a JSON line to this file')
+    args = parser.parse_args()
+    
+    try:
+        record = run_benchmark(args.video, args.csv, args.repeats)
+    except RuntimeError as e:
+        print(f"Error running benchmark: {e}")
+        sys.exit(1)
+    print(json.dumps(record, indent=2))
+    
+    if args.output:
+        with open(args.output, 'a') as file:
+            file.write(json.dumps(record) + '\n')
+        print(f"Result appended to {args.output}")
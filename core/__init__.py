@@ -1,5 +1,29 @@
-"""Core functionality package."""
-from .rep_counter import RepCounter
-from .pose_detector import PoseDetector
+"""Core functionality package.
 
-__all__ = ['RepCounter', 'PoseDetector']
+Submodules are imported on first attribute access so that importing
+``core`` does not pull in MediaPipe until a detector is actually needed.
+"""
+import importlib
+
+_LAZY_ATTRS = {
+    'RepCounter': '.rep_counter',
+    'PoseDetector': '.pose_detector',
+    'DetectorPool': '.detector_pool',
+}
+
+__all__ = ['RepCounter', 'PoseDetector', 'DetectorPool']
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access."""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List module attributes, including not-yet-imported exports."""
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,138 @@
+"""Pool of pre-initialized pose detectors for batch and server use."""
+import queue
+import threading
+from contextlib import contextmanager
+
+from .pose_detector import PoseDetector
+
+
+class DetectorPool:
+    """Holds ready-to-use PoseDetector instances for reuse across jobs."""
+    
+    def __init__(self, size=1, warmup=True, **detector_kwargs):
+        """
+        Initialize the detector pool.
+        
+        All detectors are built (and optionally warmed up) here, so the
+        MediaPipe graph cost is paid once instead of per video or request.
+        
+        Args:
+            size: Number of detectors to keep in the pool
+            warmup: Whether to run a blank frame through each detector
+            **detector_kwargs: Keyword arguments passed to PoseDetector
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        
+        self.size = size
+        self.closed = False
+        self._warmup = warmup
+        self._detectors = []
+        self._available = queue.Queue()
+        self._checked_out = set()
+        self._lock = threading.Lock()
+        
+        try:
+            for _ in range(size):
+                detector = PoseDetector(**detector_kwargs)
+                self._detectors.append(detector)
+                if warmup:
+                    detector.warmup()
+                self._available.put(detector)
+        except Exception:
+            # Don't leak the detectors built before the failure
+            self.close()
+            raise
+    
+    def acquire(self, timeout=None):
+        """
+        Take a detector from the pool, blocking until one is free.
+        
+        Detectors in the pool are always clean and warm: they are reset
+        and warmed up again when released, not here, so the caller's
+        first frame doesn't pay for a graph restart.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+        
+        Returns:
+            PoseDetector: A detector reserved for the caller
+        
+        Raises:
+            RuntimeError: If the pool has been closed
+            queue.Empty: If no detector became free within timeout
+        """
+        if self.closed:
+            raise RuntimeError("Cannot acquire from a closed DetectorPool")
+        detector = self._available.get(timeout=timeout)
+        with self._lock:
+            self._checked_out.add(detector)
+        return detector
+    
+    def release(self, detector):
+        """
+        Return a detector to the pool.
+        
+        The detector's tracking state is reset and, if the pool warms up
+        its detectors, warmed up again before it is queued, so the next
+        job neither sees landmarks from the previous one nor pays for the
+        graph restart. Detectors released after the pool is closed are
+        dropped.
+        
+        Args:
+            detector: Detector previously obtained from acquire()
+        
+        Raises:
+            ValueError: If the detector is not checked out from this pool
+        """
+        with self._lock:
+            if detector not in self._checked_out:
+                raise ValueError("Detector is not checked out from this pool")
+            self._checked_out.discard(detector)
+        
+        if self.closed:
+            return
+        detector.reset()
+        if self._warmup:
+            detector.warmup()
+        self._available.put(detector)
+    
+    @contextmanager
+    def detector(self, timeout=None):
+        """
+        Borrow a detector for the duration of a with-block.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+        
+        Yields:
+            PoseDetector: A detector reserved for the caller
+        """
+        detector = self.acquire(timeout=timeout)
+        try:
+            yield detector
+        finally:
+            self.release(detector)
+    
+    def close(self):
+        """Release resources held by every detector in the pool."""
+        self.closed = True
+        
+        # Drain the queue so closed detectors can never be handed out
+        while True:
+            try:
+                self._available.get_nowait()
+            except queue.Empty:
+                break
+        
+        for detector in self._detectors:
+            detector.close()
+        self._detectors = []
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
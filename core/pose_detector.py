@@ -27,6 +27,24 @@ class PoseDetector:
             min_tracking_confidence=min_tracking_confidence
         )
     
+    def warmup(self, frame_width=640, frame_height=480):
+        """
+        Run a blank frame through the graph so the first real frame
+        does not pay for model loading.
+
+        A blank frame contains no pose, so tracking state is left empty.
+
+        Args:
+            frame_width: Width of the warm-up frame
+            frame_height: Height of the warm-up frame
+        """
+        blank = np.zeros((frame_height, frame_width, 3), dtype=np.uint8)
+        self.process_frame(blank)
+    
+    def reset(self):
+        """Clear tracking state so the next frame starts a fresh detection."""
+        self.pose.reset()
+    
     def process_frame(self, frame):
         """
         Process a frame to detect pose landmarks.
@@ -1,27 +1,37 @@
 """Main application for bicep curl counter using pose estimation."""
+import os
+
 import cv2
-from core import PoseDetector, RepCounter
+from core import DetectorPool, RepCounter
 from ui import VideoDisplay
 from utils import CSVDataLogger
 
 
-def main():
-    """Main function to run the bicep curl counter."""
-    # Initialize components
-    pose_detector = PoseDetector(static_image_mode=False)
+def process_video(video_path, pose_detector, output_path='vid_output.mp4',
+                  csv_filename='bicep_curl_data.csv'):
+    """
+    Count bicep curl reps in a single video.
+    
+    Args:
+        video_path: Path to the input video
+        pose_detector: Initialized PoseDetector (not closed here)
+        output_path: Path to save the annotated video
+        csv_filename: Path to save the per-frame CSV data
+    
+    Returns:
+        bool: True if the user pressed ESC to stop, False otherwise
+    """
     rep_counter = RepCounter(up_threshold=160, down_threshold=70)
     video_display = VideoDisplay()
-    csv_logger = CSVDataLogger(filename='bicep_curl_data.csv', append=False)
-    
-    print("Initialization complete. Starting video capture...")
-    print("Press ESC to exit")
     
     # Start video capture
-    cap = cv2.VideoCapture("vid.mp4")
+    cap = cv2.VideoCapture(video_path)
 
     if not cap.isOpened():
-        print("Error: Could not open video file")
-        return
+        print(f"Error: Could not open video file '{video_path}'")
+        return False
+    
+    csv_logger = CSVDataLogger(filename=csv_filename, append=False)
     
     # Get video properties for output
     frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -29,12 +39,12 @@ def main():
     fps = int(cap.get(cv2.CAP_PROP_FPS))
     
     # Create video writer for output
-    output_path = 'vid_output.mp4'
     video_writer = video_display.create_video_writer(
         output_path, fps, frame_width, frame_height
     )
     print(f"Output video will be saved to: {output_path}")
 
+    stopped = False
     try:
         while cap.isOpened():
             ret, frame = cap.read()
@@ -96,6 +106,7 @@ def main():
             
             # Exit on ESC key
             if cv2.waitKey(5) & 0xFF == 27:
+                stopped = True
                 break
     
     finally:
@@ -103,11 +114,58 @@ def main():
         cap.release()
         video_display.release_video_writer(video_writer)
         cv2.destroyAllWindows()
-        pose_detector.close()
         csv_logger.close()
         print(f"\nSession complete! Total reps: {rep_counter.get_count()}")
         print(f"Output video saved to: {output_path}")
+    
+    return stopped
+
+
+def main(video_paths=None):
+    """
+    Main function to run the bicep curl counter.
+    
+    Args:
+        video_paths: List of videos to process (defaults to ['vid.mp4']).
+            When several videos are given, outputs are named after each
+            input's position and file name, and a single pre-warmed
+            detector is reused for all of them.
+            Pressing ESC stops the whole run, not just the current video.
+    """
+    video_paths = video_paths or ['vid.mp4']
+    
+    # Build and warm up the detector once, before the first frame
+    with DetectorPool(size=1, static_image_mode=False) as pool:
+        print("Initialization complete. Starting video capture...")
+        print("Press ESC to exit")
+        
+        for index, video_path in enumerate(video_paths, start=1):
+            if len(video_paths) == 1:
+                output_path = 'vid_output.mp4'
+                csv_filename = 'bicep_curl_data.csv'
+            else:
+                # Prefix the input index so inputs sharing a file name
+                # (e.g. a/vid.mp4 and b/vid.mp4) don't overwrite each other
+                stem = os.path.splitext(os.path.basename(video_path))[0]
+                output_path = f'{index}_{stem}_output.mp4'
+                csv_filename = f'{index}_{stem}_bicep_curl_data.csv'
+            
+            # Released detectors are reset and re-warmed, so each video
+            # starts with clean tracking state
+            with pool.detector() as pose_detector:
+                stopped = process_video(video_path, pose_detector,
+                                        output_path=output_path,
+                                        csv_filename=csv_filename)
+            if stopped:
+                break
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('videos', nargs='*', default=['vid.mp4'],
+                        help='Video files to process')
+    args = parser.parse_args()
+    
+    main(args.videos)
@@ -0,0 +1,45 @@
+"""Tests for the standard-library workout summary."""
+import math
+
+from analyze_data import print_summary, summarize_workout_data
+
+HEADER = 'frame_number,timestamp,rep_count,state,angle,pose_detected\n'
+
+
+def write_csv(tmp_path, rows):
+    """Write a CSVDataLogger-style file and return its path."""
+    path = tmp_path / 'data.csv'
+    path.write_text(HEADER + ''.join(row + '\n' for row in rows))
+    return str(path)
+
+
+def test_summarize_workout_data(tmp_path):
+    csv_file = write_csv(tmp_path, [
+        '0,2025-11-03 09:36:41.003,0,down,N/A,False',
+        '1,2025-11-03 09:36:41.103,0,up,165.00,True',
+        '2,2025-11-03 09:36:41.203,0,up,N/A,True',
+        '3,2025-11-03 09:36:41.303,1,down,60.00,True',
+        '4,2025-11-03 09:36:41.403,1,down,90.00,True',
+        '5,2025-11-03 09:36:41.503,1,down,N/A,False',
+    ])
+
+    summary = summarize_workout_data(csv_file)
+
+    assert summary['total_frames'] == 6
+    assert summary['detected_frames'] == 4
+    assert summary['total_reps'] == 1
+    assert summary['min_angle'] == 60.0
+    assert summary['max_angle'] == 165.0
+    assert math.isclose(summary['mean_angle'], 105.0)
+    assert summary['state_counts'] == [('down', 4), ('up', 2)]
+
+
+def test_summarize_workout_data_no_frames(tmp_path, capsys):
+    csv_file = write_csv(tmp_path, [])
+
+    summary = summarize_workout_data(csv_file)
+    print_summary(summary)
+
+    assert summary['total_frames'] == 0
+    assert math.isnan(summary['mean_angle'])
+    assert 'No frames recorded.' in capsys.readouterr().out
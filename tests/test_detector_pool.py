@@ -0,0 +1,139 @@
+"""Tests for DetectorPool using a stubbed PoseDetector."""
+import importlib
+import sys
+import types
+
+import pytest
+
+
+class StubPoseDetector:
+    """Stand-in for PoseDetector that records lifecycle calls."""
+
+    instances = []
+    fail_on_warmup = False
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.warmed_up = False
+        self.reset_count = 0
+        self.closed = False
+        StubPoseDetector.instances.append(self)
+
+    def warmup(self):
+        if StubPoseDetector.fail_on_warmup and len(self.instances) > 1:
+            raise RuntimeError("warmup failed")
+        self.warmed_up = True
+
+    def reset(self):
+        # Like SolutionBase.reset(), restarting the graph discards warmup
+        self.reset_count += 1
+        self.warmed_up = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool_module(monkeypatch):
+    """Import core.detector_pool against the stub instead of MediaPipe."""
+    import core
+
+    StubPoseDetector.instances = []
+    StubPoseDetector.fail_on_warmup = False
+    stub = types.ModuleType('core.pose_detector')
+    stub.PoseDetector = StubPoseDetector
+    monkeypatch.setitem(sys.modules, 'core.pose_detector', stub)
+    monkeypatch.delitem(sys.modules, 'core.detector_pool', raising=False)
+    monkeypatch.delattr(core, 'detector_pool', raising=False)
+    module = importlib.import_module('core.detector_pool')
+    yield module
+    sys.modules.pop('core.detector_pool', None)
+    if hasattr(core, 'detector_pool'):
+        delattr(core, 'detector_pool')
+
+
+def test_builds_and_warms_up_detectors(pool_module):
+    pool = pool_module.DetectorPool(size=2, static_image_mode=True)
+
+    assert len(StubPoseDetector.instances) == 2
+    for detector in StubPoseDetector.instances:
+        assert detector.warmed_up
+        assert detector.kwargs == {'static_image_mode': True}
+    pool.close()
+
+
+def test_acquire_hands_out_warm_detector(pool_module):
+    pool = pool_module.DetectorPool(size=1)
+
+    detector = pool.acquire(timeout=0)
+
+    assert detector.reset_count == 0
+    assert detector.warmed_up
+    pool.close()
+
+
+def test_release_resets_and_rewarms(pool_module):
+    pool = pool_module.DetectorPool(size=1)
+
+    with pool.detector() as detector:
+        pass
+
+    assert detector.reset_count == 1
+    assert detector.warmed_up
+    assert pool.acquire(timeout=0) is detector
+    assert detector.reset_count == 1
+    pool.close()
+
+
+def test_release_without_warmup_only_resets(pool_module):
+    pool = pool_module.DetectorPool(size=1, warmup=False)
+
+    with pool.detector() as detector:
+        pass
+
+    assert detector.reset_count == 1
+    assert not detector.warmed_up
+    pool.close()
+
+
+def test_release_rejects_double_release(pool_module):
+    pool = pool_module.DetectorPool(size=1)
+    detector = pool.acquire(timeout=0)
+    pool.release(detector)
+
+    with pytest.raises(ValueError):
+        pool.release(detector)
+    assert pool.acquire(timeout=0) is detector
+    assert pool._available.empty()
+    pool.close()
+
+
+def test_release_rejects_foreign_detector(pool_module):
+    pool = pool_module.DetectorPool(size=1)
+
+    with pytest.raises(ValueError):
+        pool.release(StubPoseDetector())
+    pool.close()
+
+
+def test_close_drains_pool(pool_module):
+    pool = pool_module.DetectorPool(size=2)
+    detector = pool.acquire()
+
+    pool.close()
+    pool.release(detector)
+
+    assert all(d.closed for d in StubPoseDetector.instances)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=0)
+    assert pool._available.empty()
+
+
+def test_init_failure_closes_built_detectors(pool_module):
+    StubPoseDetector.fail_on_warmup = True
+
+    with pytest.raises(RuntimeError, match="warmup failed"):
+        pool_module.DetectorPool(size=3)
+
+    assert len(StubPoseDetector.instances) == 2
+    assert all(d.closed for d in StubPoseDetector.instances)
@@ -0,0 +1,31 @@
+"""Tests that heavy dependencies stay out of the fast startup paths."""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(snippet, names):
+    """Run a snippet in a fresh interpreter and report which names got imported."""
+    check = f'import sys; print([n for n in {names!r} if n in sys.modules])'
+    result = subprocess.run(
+        [sys.executable, '-c', f'{snippet}\n{check}'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_import_core_skips_mediapipe():
+    assert loaded_modules('import core', ['mediapipe', 'cv2']) == '[]'
+
+
+def test_summary_skips_pandas_and_matplotlib():
+    snippet = (
+        'from analyze_data import summarize_workout_data\n'
+        "summarize_workout_data('bicep_curl_data.csv')"
+    )
+    assert loaded_modules(snippet, ['pandas', 'matplotlib']) == '[]'